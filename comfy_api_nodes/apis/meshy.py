@@ -1,8 +1,11 @@
-from typing import TypedDict
+from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Literal, TypedDict
 
-from comfy_api.latest import Input
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from comfy_api.latest import Input
 
 
 class InputShouldRemesh(TypedDict):
@@ -19,142 +22,157 @@ class InputShouldTexture(TypedDict):
 
 
 class MeshyTaskResponse(BaseModel):
-    result: str = Field(...)
+    model_config = ConfigDict(frozen=True)
 
+    result: str
 
-class MeshyTextToModelRequest(BaseModel):
-    mode: str = Field("preview")
-    prompt: str = Field(..., max_length=600)
-    art_style: str = Field(..., description="'realistic' or 'sculpture'")
-    ai_model: str = Field(...)
-    topology: str | None = Field(..., description="'quad' or 'triangle'")
+
+class _MeshyModelRequestBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ai_model: str
+    topology: Literal["quad", "triangle"] | None
     target_polycount: int | None = Field(..., ge=100, le=300000)
     should_remesh: bool = Field(
         True,
         description="False returns the original mesh, ignoring topology and polycount.",
     )
-    symmetry_mode: str = Field(..., description="'auto', 'off' or 'on'")
-    pose_mode: str = Field(...)
-    seed: int = Field(...)
-    moderation: bool = Field(False)
+    symmetry_mode: Literal["auto", "off", "on"]
+    pose_mode: str
+    seed: int
+    moderation: bool = False
+
+
+class MeshyTextToModelRequest(_MeshyModelRequestBase):
+    mode: Literal["preview"] = "preview"
+    prompt: str = Field(..., max_length=600)
+    art_style: Literal["realistic", "sculpture"]
 
 
 class MeshyRefineTask(BaseModel):
-    mode: str = Field("refine")
-    preview_task_id: str = Field(...)
-    enable_pbr: bool | None = Field(...)
-    texture_prompt: str | None = Field(...)
-    texture_image_url: str | None = Field(...)
-    ai_model: str = Field(...)
-    moderation: bool = Field(False)
-
-
-class MeshyImageToModelRequest(BaseModel):
-    image_url: str = Field(...)
-    ai_model: str = Field(...)
-    topology: str | None = Field(..., description="'quad' or 'triangle'")
-    target_polycount: int | None = Field(..., ge=100, le=300000)
-    symmetry_mode: str = Field(..., description="'auto', 'off' or 'on'")
-    should_remesh: bool = Field(
-        True,
-        description="False returns the original mesh, ignoring topology and polycount.",
-    )
-    should_texture: bool = Field(...)
-    enable_pbr: bool | None = Field(...)
-    pose_mode: str = Field(...)
+    model_config = ConfigDict(defer_build=True)
+
+    mode: Literal["refine"] = "refine"
+    preview_task_id: str
+    enable_pbr: bool | None
+    texture_prompt: str | None
+    texture_image_url: str | None
+    ai_model: str
+    moderation: bool = False
+
+
+class MeshyImageToModelRequest(_MeshyModelRequestBase):
+    image_url: str
+    should_texture: bool
+    enable_pbr: bool | None
     texture_prompt: str | None = Field(None, max_length=600)
-    texture_image_url: str | None = Field(None)
-    seed: int = Field(...)
-    moderation: bool = Field(False)
+    texture_image_url: str | None = None
 
 
-class MeshyMultiImageToModelRequest(BaseModel):
-    image_urls: list[str] = Field(...)
-    ai_model: str = Field(...)
-    topology: str | None = Field(..., description="'quad' or 'triangle'")
-    target_polycount: int | None = Field(..., ge=100, le=300000)
-    symmetry_mode: str = Field(..., description="'auto', 'off' or 'on'")
-    should_remesh: bool = Field(
-        True,
-        description="False returns the original mesh, ignoring topology and polycount.",
-    )
-    should_texture: bool = Field(...)
-    enable_pbr: bool | None = Field(...)
-    pose_mode: str = Field(...)
+class MeshyMultiImageToModelRequest(_MeshyModelRequestBase):
+    image_urls: list[str]
+    should_texture: bool
+    enable_pbr: bool | None
     texture_prompt: str | None = Field(None, max_length=600)
-    texture_image_url: str | None = Field(None)
-    seed: int = Field(...)
-    moderation: bool = Field(False)
+    texture_image_url: str | None = None
 
 
 class MeshyRiggingRequest(BaseModel):
-    input_task_id: str = Field(...)
-    height_meters: float = Field(...)
-    texture_image_url: str | None = Field(...)
+    model_config = ConfigDict(defer_build=True)
+
+    input_task_id: str
+    height_meters: float
+    texture_image_url: str | None
 
 
 class MeshyAnimationRequest(BaseModel):
-    rig_task_id: str = Field(...)
-    action_id: int = Field(...)
+    model_config = ConfigDict(defer_build=True)
+
+    rig_task_id: str
+    action_id: int
 
 
 class MeshyTextureRequest(BaseModel):
-    input_task_id: str = Field(...)
-    ai_model: str = Field(...)
-    enable_original_uv: bool = Field(...)
-    enable_pbr: bool = Field(...)
-    text_style_prompt: str | None = Field(...)
-    image_style_url: str | None = Field(...)
+    model_config = ConfigDict(defer_build=True)
+
+    input_task_id: str
+    ai_model: str
+    enable_original_uv: bool
+    enable_pbr: bool
+    text_style_prompt: str | None
+    image_style_url: str | None
 
 
 class MeshyModelsUrls(BaseModel):
-    glb: str = Field("")
+    model_config = ConfigDict(frozen=True)
+
+    glb: str = ""
 
 
 class MeshyRiggedModelsUrls(BaseModel):
-    rigged_character_glb_url: str = Field("")
+    model_config = ConfigDict(frozen=True)
+
+    rigged_character_glb_url: str = ""
 
 
 class MeshyAnimatedModelsUrls(BaseModel):
-    animation_glb_url: str = Field("")
+    model_config = ConfigDict(frozen=True)
+
+    animation_glb_url: str = ""
+
+
+# The URL models are frozen, so Pydantic shares these defaults instead of copying them per instance.
+_EMPTY_MODEL_URLS = MeshyModelsUrls()
+_EMPTY_RIGGED_URLS = MeshyRiggedModelsUrls()
+_EMPTY_ANIMATED_URLS = MeshyAnimatedModelsUrls()
 
 
 class MeshyResultTextureUrls(BaseModel):
-    base_color: str = Field(...)
-    metallic: str | None = Field(None)
-    normal: str | None = Field(None)
-    roughness: str | None = Field(None)
+    model_config = ConfigDict(frozen=True)
+
+    base_color: str
+    metallic: str | None = None
+    normal: str | None = None
+    roughness: str | None = None
 
 
 class MeshyTaskError(BaseModel):
-    message: str | None = Field(None)
+    model_config = ConfigDict(frozen=True)
+
+    message: str | None = None
 
 
 class MeshyModelResult(BaseModel):
-    id: str = Field(...)
-    type: str = Field(...)
-    model_urls: MeshyModelsUrls = Field(MeshyModelsUrls())
-    thumbnail_url: str = Field(...)
-    video_url: str | None = Field(None)
-    status: str = Field(...)
-    progress: int = Field(0)
-    texture_urls: list[MeshyResultTextureUrls] | None = Field([])
-    task_error: MeshyTaskError | None = Field(None)
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    id: str
+    type: str
+    model_urls: MeshyModelsUrls = _EMPTY_MODEL_URLS
+    thumbnail_url: str
+    video_url: str | None = None
+    status: str
+    progress: int = 0
+    texture_urls: tuple[MeshyResultTextureUrls, ...] | None = ()
+    task_error: MeshyTaskError | None = None
 
 
 class MeshyRiggedResult(BaseModel):
-    id: str = Field(...)
-    type: str = Field(...)
-    status: str = Field(...)
-    progress: int = Field(0)
-    result: MeshyRiggedModelsUrls = Field(MeshyRiggedModelsUrls())
-    task_error: MeshyTaskError | None = Field(None)
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    id: str
+    type: str
+    status: str
+    progress: int = 0
+    result: MeshyRiggedModelsUrls = _EMPTY_RIGGED_URLS
+    task_error: MeshyTaskError | None = None
 
 
 class MeshyAnimationResult(BaseModel):
-    id: str = Field(...)
-    type: str = Field(...)
-    status: str = Field(...)
-    progress: int = Field(0)
-    result: MeshyAnimatedModelsUrls = Field(MeshyAnimatedModelsUrls())
-    task_error: MeshyTaskError | None = Field(None)
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    id: str
+    type: str
+    status: str
+    progress: int = 0
+    result: MeshyAnimatedModelsUrls = _EMPTY_ANIMATED_URLS
+    task_error: MeshyTaskError | None = None
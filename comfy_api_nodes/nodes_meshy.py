@@ -1,4 +1,7 @@
+import asyncio
 import os
+from collections.abc import Callable
+from typing import Any
 
 from typing_extensions import override
 
@@ -21,14 +24,89 @@ from comfy_api_nodes.apis.meshy import (
 from comfy_api_nodes.util import (
     ApiEndpoint,
     download_url_to_bytesio,
-    poll_op,
+    poll_op_raw,
     sync_op,
     upload_images_to_comfyapi,
+    validate_response_model,
     validate_string,
 )
 from folder_paths import get_output_directory
 
 
+async def _poll_and_download(
+    cls: type[IO.ComfyNode],
+    poll_path: str,
+    task_id: str,
+    response_model: type[MeshyModelResult | MeshyRiggedResult | MeshyAnimationResult],
+    glb_url: Callable[[Any], str],
+) -> str:
+    """Poll a Meshy task until it finishes, save its GLB to the output directory and return the file name."""
+    # Intermediate polls only need status and progress; the full result is validated once at the end.
+    raw = await poll_op_raw(
+        cls,
+        ApiEndpoint(path=f"{poll_path}/{task_id}"),
+        status_extractor=lambda r: r.get("status"),
+        progress_extractor=lambda r: r.get("progress"),
+        max_poll_interval=15.0,
+    )
+    result = validate_response_model(response_model, raw)
+    model_file = f"meshy_model_{task_id}.glb"
+    await download_url_to_bytesio(glb_url(result), os.path.join(get_output_directory(), model_file))
+    return model_file
+
+
+def _resolve_remesh_inputs(should_remesh: InputShouldRemesh) -> tuple[bool, str | None, int | None]:
+    """Return (enabled, topology, target_polycount) from the remesh options."""
+    if should_remesh["should_remesh"] != "true":
+        return False, None, None
+    return True, should_remesh.get("topology"), should_remesh.get("target_polycount")
+
+
+def _validate_texture_inputs(texture_prompt: str | None, texture_image: Input.Image | None) -> None:
+    if texture_prompt and texture_image is not None:
+        raise ValueError("texture_prompt and texture_image cannot be used at the same time")
+    if texture_prompt:
+        validate_string(texture_prompt, field_name="texture_prompt", max_length=600)
+
+
+def _resolve_texture_inputs(should_texture: InputShouldTexture) -> tuple[bool, str | None, Input.Image | None]:
+    """Validate the texture options and return (enabled, prompt, image) before anything is uploaded or billed."""
+    if should_texture["should_texture"] != "true":
+        return False, None, None
+    texture_prompt = should_texture["texture_prompt"] or None
+    texture_image = should_texture["texture_image"]
+    _validate_texture_inputs(texture_prompt, texture_image)
+    return True, texture_prompt, texture_image
+
+
+async def _upload_texture_image(cls: type[IO.ComfyNode], texture_image: Input.Image | None) -> str | None:
+    if texture_image is None:
+        return None
+    return (await upload_images_to_comfyapi(cls, texture_image, wait_label="Uploading texture"))[0]
+
+
+async def _upload_model_images(
+    cls: type[IO.ComfyNode],
+    images: Input.Image | list[Input.Image],
+    texture_image: Input.Image | None,
+    *,
+    wait_label: str,
+) -> tuple[list[str], str | None]:
+    """Upload the base image(s) and the optional texture image concurrently; a failure cancels the other upload."""
+    tasks = [
+        asyncio.create_task(upload_images_to_comfyapi(cls, images, wait_label=wait_label)),
+        asyncio.create_task(_upload_texture_image(cls, texture_image)),
+    ]
+    try:
+        image_urls, texture_image_url = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return image_urls, texture_image_url
+
+
 class MeshyTextToModelNode(IO.ComfyNode):
 
     @classmethod
@@ -106,6 +184,7 @@ class MeshyTextToModelNode(IO.ComfyNode):
         seed: int,
     ) -> IO.NodeOutput:
         validate_string(prompt, field_name="prompt", min_length=1, max_length=600)
+        remesh, topology, target_polycount = _resolve_remesh_inputs(should_remesh)
         response = await sync_op(
             cls,
             ApiEndpoint(path="/proxy/meshy/openapi/v2/text-to-3d", method="POST"),
@@ -114,23 +193,17 @@ class MeshyTextToModelNode(IO.ComfyNode):
                 prompt=prompt,
                 art_style=style,
                 ai_model=model,
-                topology=should_remesh.get("topology", None),
-                target_polycount=should_remesh.get("target_polycount", None),
-                should_remesh=should_remesh["should_remesh"] == "true",
+                topology=topology,
+                target_polycount=target_polycount,
+                should_remesh=remesh,
                 symmetry_mode=symmetry_mode,
                 pose_mode=pose_mode.lower(),
                 seed=seed,
             ),
         )
-        result = await poll_op(
-            cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v2/text-to-3d/{response.result}"),
-            response_model=MeshyModelResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
+        model_file = await _poll_and_download(
+            cls, "/proxy/meshy/openapi/v2/text-to-3d", response.result, MeshyModelResult, lambda r: r.model_urls.glb
         )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(result.model_urls.glb, os.path.join(get_output_directory(), model_file))
         return IO.NodeOutput(model_file, response.result)
 
 
@@ -191,13 +264,8 @@ class MeshyRefineNode(IO.ComfyNode):
         texture_prompt: str,
         texture_image: Input.Image | None = None,
     ) -> IO.NodeOutput:
-        if texture_prompt and texture_image is not None:
-            raise ValueError("texture_prompt and texture_image cannot be used at the same time")
-        texture_image_url = None
-        if texture_prompt:
-            validate_string(texture_prompt, field_name="texture_prompt", max_length=600)
-        if texture_image is not None:
-            texture_image_url = (await upload_images_to_comfyapi(cls, texture_image, wait_label="Uploading texture"))[0]
+        _validate_texture_inputs(texture_prompt, texture_image)
+        texture_image_url = await _upload_texture_image(cls, texture_image)
         response = await sync_op(
             cls,
             endpoint=ApiEndpoint(path="/proxy/meshy/openapi/v2/text-to-3d", method="POST"),
@@ -210,15 +278,9 @@ class MeshyRefineNode(IO.ComfyNode):
                 ai_model=model,
             ),
         )
-        result = await poll_op(
-            cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v2/text-to-3d/{response.result}"),
-            response_model=MeshyModelResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
+        model_file = await _poll_and_download(
+            cls, "/proxy/meshy/openapi/v2/text-to-3d", response.result, MeshyModelResult, lambda r: r.model_urls.glb
         )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(result.model_urls.glb, os.path.join(get_output_directory(), model_file))
         return IO.NodeOutput(model_file, response.result)
 
 
@@ -335,31 +397,22 @@ class MeshyImageToModelNode(IO.ComfyNode):
         pose_mode: str,
         seed: int,
     ) -> IO.NodeOutput:
-        texture = should_texture["should_texture"] == "true"
-        texture_image_url = texture_prompt = None
-        if texture:
-            if should_texture["texture_prompt"] and should_texture["texture_image"] is not None:
-                raise ValueError("texture_prompt and texture_image cannot be used at the same time")
-            if should_texture["texture_prompt"]:
-                validate_string(should_texture["texture_prompt"], field_name="texture_prompt", max_length=600)
-                texture_prompt = should_texture["texture_prompt"]
-            if should_texture["texture_image"] is not None:
-                texture_image_url = (
-                    await upload_images_to_comfyapi(
-                        cls, should_texture["texture_image"], wait_label="Uploading texture"
-                    )
-                )[0]
+        remesh, topology, target_polycount = _resolve_remesh_inputs(should_remesh)
+        texture, texture_prompt, texture_image = _resolve_texture_inputs(should_texture)
+        image_urls, texture_image_url = await _upload_model_images(
+            cls, image, texture_image, wait_label="Uploading base image"
+        )
         response = await sync_op(
             cls,
             ApiEndpoint(path="/proxy/meshy/openapi/v1/image-to-3d", method="POST"),
             response_model=MeshyTaskResponse,
             data=MeshyImageToModelRequest(
-                image_url=(await upload_images_to_comfyapi(cls, image, wait_label="Uploading base image"))[0],
+                image_url=image_urls[0],
                 ai_model=model,
-                topology=should_remesh.get("topology", None),
-                target_polycount=should_remesh.get("target_polycount", None),
+                topology=topology,
+                target_polycount=target_polycount,
                 symmetry_mode=symmetry_mode,
-                should_remesh=should_remesh["should_remesh"] == "true",
+                should_remesh=remesh,
                 should_texture=texture,
                 enable_pbr=should_texture.get("enable_pbr", None),
                 pose_mode=pose_mode.lower(),
@@ -368,15 +421,9 @@ class MeshyImageToModelNode(IO.ComfyNode):
                 seed=seed,
             ),
         )
-        result = await poll_op(
-            cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v1/image-to-3d/{response.result}"),
-            response_model=MeshyModelResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
+        model_file = await _poll_and_download(
+            cls, "/proxy/meshy/openapi/v1/image-to-3d", response.result, MeshyModelResult, lambda r: r.model_urls.glb
         )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(result.model_urls.glb, os.path.join(get_output_directory(), model_file))
         return IO.NodeOutput(model_file, response.result)
 
 
@@ -496,33 +543,22 @@ class MeshyMultiImageToModelNode(IO.ComfyNode):
         pose_mode: str,
         seed: int,
     ) -> IO.NodeOutput:
-        texture = should_texture["should_texture"] == "true"
-        texture_image_url = texture_prompt = None
-        if texture:
-            if should_texture["texture_prompt"] and should_texture["texture_image"] is not None:
-                raise ValueError("texture_prompt and texture_image cannot be used at the same time")
-            if should_texture["texture_prompt"]:
-                validate_string(should_texture["texture_prompt"], field_name="texture_prompt", max_length=600)
-                texture_prompt = should_texture["texture_prompt"]
-            if should_texture["texture_image"] is not None:
-                texture_image_url = (
-                    await upload_images_to_comfyapi(
-                        cls, should_texture["texture_image"], wait_label="Uploading texture"
-                    )
-                )[0]
+        remesh, topology, target_polycount = _resolve_remesh_inputs(should_remesh)
+        texture, texture_prompt, texture_image = _resolve_texture_inputs(should_texture)
+        image_urls, texture_image_url = await _upload_model_images(
+            cls, list(images.values()), texture_image, wait_label="Uploading base images"
+        )
         response = await sync_op(
             cls,
             ApiEndpoint(path="/proxy/meshy/openapi/v1/multi-image-to-3d", method="POST"),
             response_model=MeshyTaskResponse,
             data=MeshyMultiImageToModelRequest(
-                image_urls=await upload_images_to_comfyapi(
-                    cls, list(images.values()), wait_label="Uploading base images"
-                ),
+                image_urls=image_urls,
                 ai_model=model,
-                topology=should_remesh.get("topology", None),
-                target_polycount=should_remesh.get("target_polycount", None),
+                topology=topology,
+                target_polycount=target_polycount,
                 symmetry_mode=symmetry_mode,
-                should_remesh=should_remesh["should_remesh"] == "true",
+                should_remesh=remesh,
                 should_texture=texture,
                 enable_pbr=should_texture.get("enable_pbr", None),
                 pose_mode=pose_mode.lower(),
@@ -531,15 +567,13 @@ class MeshyMultiImageToModelNode(IO.ComfyNode):
                 seed=seed,
             ),
         )
-        result = await poll_op(
+        model_file = await _poll_and_download(
             cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v1/multi-image-to-3d/{response.result}"),
-            response_model=MeshyModelResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
+            "/proxy/meshy/openapi/v1/multi-image-to-3d",
+            response.result,
+            MeshyModelResult,
+            lambda r: r.model_urls.glb,
         )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(result.model_urls.glb, os.path.join(get_output_directory(), model_file))
         return IO.NodeOutput(model_file, response.result)
 
 
@@ -593,9 +627,7 @@ class MeshyRigModelNode(IO.ComfyNode):
         height_meters: float,
         texture_image: Input.Image | None = None,
     ) -> IO.NodeOutput:
-        texture_image_url = None
-        if texture_image is not None:
-            texture_image_url = (await upload_images_to_comfyapi(cls, texture_image, wait_label="Uploading texture"))[0]
+        texture_image_url = await _upload_texture_image(cls, texture_image)
         response = await sync_op(
             cls,
             endpoint=ApiEndpoint(path="/proxy/meshy/openapi/v1/rigging", method="POST"),
@@ -606,16 +638,12 @@ class MeshyRigModelNode(IO.ComfyNode):
                 texture_image_url=texture_image_url,
             ),
         )
-        result = await poll_op(
+        model_file = await _poll_and_download(
             cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v1/rigging/{response.result}"),
-            response_model=MeshyRiggedResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
-        )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(
-            result.result.rigged_character_glb_url, os.path.join(get_output_directory(), model_file)
+            "/proxy/meshy/openapi/v1/rigging",
+            response.result,
+            MeshyRiggedResult,
+            lambda r: r.result.rigged_character_glb_url,
         )
         return IO.NodeOutput(model_file, response.result)
 
@@ -669,15 +697,13 @@ class MeshyAnimateModelNode(IO.ComfyNode):
                 action_id=action_id,
             ),
         )
-        result = await poll_op(
+        model_file = await _poll_and_download(
             cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v1/animations/{response.result}"),
-            response_model=MeshyAnimationResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
+            "/proxy/meshy/openapi/v1/animations",
+            response.result,
+            MeshyAnimationResult,
+            lambda r: r.result.animation_glb_url,
         )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(result.result.animation_glb_url, os.path.join(get_output_directory(), model_file))
         return IO.NodeOutput(model_file, response.result)
 
 
@@ -744,6 +770,8 @@ class MeshyTextureNode(IO.ComfyNode):
             raise ValueError("text_style_prompt and image_style cannot be used at the same time")
         if not text_style_prompt and image_style is None:
             raise ValueError("Either text_style_prompt or image_style is required")
+        if text_style_prompt:
+            validate_string(text_style_prompt, field_name="text_style_prompt", max_length=600)
         image_style_url = None
         if image_style is not None:
             image_style_url = (await upload_images_to_comfyapi(cls, image_style, wait_label="Uploading style"))[0]
@@ -760,15 +788,9 @@ class MeshyTextureNode(IO.ComfyNode):
                 image_style_url=image_style_url,
             ),
         )
-        result = await poll_op(
-            cls,
-            ApiEndpoint(path=f"/proxy/meshy/openapi/v1/retexture/{response.result}"),
-            response_model=MeshyModelResult,
-            status_extractor=lambda r: r.status,
-            progress_extractor=lambda r: r.progress,
+        model_file = await _poll_and_download(
+            cls, "/proxy/meshy/openapi/v1/retexture", response.result, MeshyModelResult, lambda r: r.model_urls.glb
         )
-        model_file = f"meshy_model_{response.result}.glb"
-        await download_url_to_bytesio(result.model_urls.glb, os.path.join(get_output_directory(), model_file))
         return IO.NodeOutput(model_file, response.result)
 
 
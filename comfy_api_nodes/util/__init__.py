@@ -5,6 +5,7 @@ from .client import (
     poll_op_raw,
     sync_op,
     sync_op_raw,
+    validate_response_model,
 )
 from .conversions import (
     audio_bytes_to_audio_input,
@@ -57,6 +58,7 @@ __all__ = [
     "poll_op_raw",
     "sync_op",
     "sync_op_raw",
+    "validate_response_model",
     # Upload helpers
     "upload_audio_to_comfyapi",
     "upload_file_to_comfyapi",
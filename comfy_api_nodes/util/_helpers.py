@@ -6,6 +6,7 @@ import time
 from collections.abc import Callable
 from io import BytesIO
 
+import aiohttp
 from yarl import URL
 
 from comfy.cli_args import args
@@ -17,6 +18,8 @@ from .common_exceptions import ProcessingInterrupted
 _HAS_PCT_ESC = re.compile(r"%[0-9A-Fa-f]{2}")  # any % followed by 2 hex digits
 _HAS_BAD_PCT = re.compile(r"%(?![0-9A-Fa-f]{2})")  # any % not followed by 2 hex digits
 
+_SESSIONS: dict[asyncio.AbstractEventLoop, tuple[aiohttp.ClientSession, asyncio.Task]] = {}
+
 
 def is_processing_interrupted() -> bool:
     """Return True if user/runtime requested interruption."""
@@ -39,6 +42,41 @@ def default_base_url() -> str:
     return getattr(args, "comfy_api_base", "https://api.comfy.org")
 
 
+def get_client_session() -> aiohttp.ClientSession:
+    """
+    Return the aiohttp session shared by all API requests on the running event loop.
+
+    Reusing one session keeps connections to the API proxy and storage hosts alive across the upload,
+    submit, poll and download requests of a node instead of paying a TCP+TLS handshake for each of them.
+    Each prompt executes in its own event loop, so sessions are kept per loop and closed when the loop
+    cancels its remaining tasks on shutdown. Timeouts must be passed per request.
+    """
+    for stale_loop in [lp for lp in _SESSIONS if lp.is_closed()]:
+        # Closed without cancelling its tasks, so the shutdown hook never ran; drop the references to it.
+        del _SESSIONS[stale_loop]
+    loop = asyncio.get_running_loop()
+    entry = _SESSIONS.get(loop)
+    if entry is not None and not entry[0].closed:
+        return entry[0]
+    # Cookies are not shared between requests, matching the previous one-session-per-request behaviour.
+    # aiohttp drops idle connections after 15s by default, which is as long as a backed-off poll interval.
+    connector = aiohttp.TCPConnector(keepalive_timeout=60, ttl_dns_cache=300)
+    session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+    _SESSIONS[loop] = (session, loop.create_task(_close_session_on_shutdown(loop, session)))
+    return session
+
+
+async def _close_session_on_shutdown(loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession) -> None:
+    try:
+        await loop.create_future()  # wait until the loop cancels its pending tasks
+    except asyncio.CancelledError:
+        entry = _SESSIONS.get(loop)
+        if entry is not None and entry[0] is session:
+            del _SESSIONS[loop]
+        await session.close()
+        raise
+
+
 async def sleep_with_interrupt(
     seconds: float,
     node_cls: type[IO.ComfyNode] | None,
@@ -2,6 +2,7 @@ import asyncio
 import contextlib
 import json
 import logging
+import random
 import time
 import uuid
 from collections.abc import Callable, Iterable
@@ -14,6 +15,7 @@ from urllib.parse import urljoin, urlparse
 import aiohttp
 from aiohttp.client_exceptions import ClientError, ContentTypeError
 from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
 from comfy import utils
 from comfy_api.latest import IO
@@ -23,6 +25,7 @@ from . import request_logger
 from ._helpers import (
     default_base_url,
     get_auth_header,
+    get_client_session,
     get_node_id,
     is_processing_interrupted,
     sleep_with_interrupt,
@@ -79,6 +82,7 @@ class _PollUIState:
 
 
 _RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+_POLL_PROGRESS_STEP = 5  # progress gain per poll (out of 100) that counts as moving fast enough to poll sooner
 COMPLETED_STATUSES = ["succeeded", "succeed", "success", "completed", "finished", "done", "complete"]
 FAILED_STATUSES = ["cancelled", "canceled", "canceling", "fail", "failed", "error"]
 QUEUED_STATUSES = ["created", "queued", "queueing", "submitted", "initializing"]
@@ -104,10 +108,11 @@ async def sync_op(
     progress_origin_ts: float | None = None,
     monitor_progress: bool = True,
 ) -> M:
+    validate = _cached_model_validator(response_model)
     raw = await sync_op_raw(
         cls,
         endpoint,
-        price_extractor=_wrap_model_extractor(response_model, price_extractor),
+        price_extractor=_wrap_model_extractor(validate, price_extractor),
         data=data,
         files=files,
         content_type=content_type,
@@ -125,7 +130,7 @@ async def sync_op(
     )
     if not isinstance(raw, dict):
         raise Exception("Expected JSON response to validate into a Pydantic model, got non-JSON (binary or text).")
-    return _validate_or_raise(response_model, raw)
+    return validate(raw)
 
 
 async def poll_op(
@@ -141,6 +146,7 @@ async def poll_op(
     queued_statuses: list[str | int] | None = None,
     data: BaseModel | None = None,
     poll_interval: float = 5.0,
+    max_poll_interval: float | None = None,
     max_poll_attempts: int = 120,
     timeout_per_poll: float = 120.0,
     max_retries_per_poll: int = 3,
@@ -150,17 +156,19 @@ async def poll_op(
     cancel_endpoint: ApiEndpoint | None = None,
     cancel_timeout: float = 10.0,
 ) -> M:
+    validate = _cached_model_validator(response_model)
     raw = await poll_op_raw(
         cls,
         poll_endpoint=poll_endpoint,
-        status_extractor=_wrap_model_extractor(response_model, status_extractor),
-        progress_extractor=_wrap_model_extractor(response_model, progress_extractor),
-        price_extractor=_wrap_model_extractor(response_model, price_extractor),
+        status_extractor=_wrap_model_extractor(validate, status_extractor),
+        progress_extractor=_wrap_model_extractor(validate, progress_extractor),
+        price_extractor=_wrap_model_extractor(validate, price_extractor),
         completed_statuses=completed_statuses,
         failed_statuses=failed_statuses,
         queued_statuses=queued_statuses,
         data=data,
         poll_interval=poll_interval,
+        max_poll_interval=max_poll_interval,
         max_poll_attempts=max_poll_attempts,
         timeout_per_poll=timeout_per_poll,
         max_retries_per_poll=max_retries_per_poll,
@@ -172,7 +180,7 @@ async def poll_op(
     )
     if not isinstance(raw, dict):
         raise Exception("Expected JSON response to validate into a Pydantic model, got non-JSON (binary or text).")
-    return _validate_or_raise(response_model, raw)
+    return validate(raw)
 
 
 async def sync_op_raw(
@@ -238,6 +246,7 @@ async def poll_op_raw(
     queued_statuses: list[str | int] | None = None,
     data: dict[str, Any] | BaseModel | None = None,
     poll_interval: float = 5.0,
+    max_poll_interval: float | None = None,
     max_poll_attempts: int = 120,
     timeout_per_poll: float = 120.0,
     max_retries_per_poll: int = 3,
@@ -253,6 +262,12 @@ async def poll_op_raw(
 
     Uses default complete, failed and queued states assumption.
 
+    If `max_poll_interval` is set, the wait between polls doubles (with jitter) from `poll_interval`
+    up to `max_poll_interval` while the task reports little or no progress, and halves (down to
+    `poll_interval`) whenever progress advances by at least `_POLL_PROGRESS_STEP` points in one poll.
+    The timeout budget stays that of the fixed schedule: polling stops after `max_poll_attempts`
+    non-queued polls or `max_poll_attempts * poll_interval` seconds of active polling, whichever comes first.
+
     Returns the final JSON response from the poll endpoint.
     """
     completed_states = _normalize_statuses(COMPLETED_STATUSES if completed_statuses is None else completed_statuses)
@@ -260,6 +275,10 @@ async def poll_op_raw(
     queued_states = _normalize_statuses(QUEUED_STATUSES if queued_statuses is None else queued_statuses)
     started = time.monotonic()
     consumed_attempts = 0  # counts only non-queued polls
+    active_poll_seconds = 0.0  # time slept between non-queued polls
+    interval = poll_interval
+    # backed-off polls must not stretch the timeout past what the fixed schedule would allow
+    active_poll_budget = max_poll_attempts * poll_interval if max_poll_interval is not None else float("inf")
 
     progress_bar = utils.ProgressBar(100) if progress_extractor else None
     last_progress: int | None = None
@@ -292,7 +311,7 @@ async def poll_op_raw(
 
     ticker_task = asyncio.create_task(_ticker())
     try:
-        while consumed_attempts < max_poll_attempts:
+        while consumed_attempts < max_poll_attempts and active_poll_seconds < active_poll_budget:
             try:
                 resp_json = await sync_op_raw(
                     cls,
@@ -337,10 +356,12 @@ async def poll_op_raw(
                 if new_price is not None:
                     state.price = new_price
 
+            progress_gain = 0
             if progress_extractor:
                 new_progress = progress_extractor(resp_json)
                 if new_progress is not None and last_progress != new_progress:
                     progress_bar.update_absolute(new_progress, total=100)
+                    progress_gain = new_progress - (last_progress or 0)
                     last_progress = new_progress
 
             now_ts = time.monotonic()
@@ -383,8 +404,17 @@ async def poll_op_raw(
                 logging.error(msg)
                 raise Exception(msg)
 
+            if max_poll_interval is not None:
+                if progress_gain >= _POLL_PROGRESS_STEP:
+                    interval = max(interval / 2, poll_interval)
+                else:
+                    interval = min(interval * 2, max_poll_interval)
+                # jitter spreads out concurrent pollers without ever polling faster than poll_interval
+                delay = random.uniform(max(poll_interval, interval / 2), interval)
+            else:
+                delay = poll_interval
             try:
-                await sleep_with_interrupt(poll_interval, cls, None, None, None)
+                await sleep_with_interrupt(delay, cls, None, None, None)
             except ProcessingInterrupted:
                 if cancel_endpoint:
                     with contextlib.suppress(Exception):
@@ -402,10 +432,11 @@ async def poll_op_raw(
                 raise
             if not is_queued:
                 consumed_attempts += 1
+                active_poll_seconds += delay
 
         raise Exception(
-            f"Polling timed out after {max_poll_attempts} non-queued attempts "
-            f"(~{int(max_poll_attempts * poll_interval)}s of active polling)."
+            f"Polling timed out after {consumed_attempts} non-queued attempts "
+            f"(~{int(active_poll_seconds)}s of active polling)."
         )
     except ProcessingInterrupted:
         raise
@@ -583,6 +614,12 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
         except asyncio.CancelledError:
             return  # normal shutdown
 
+    # JSON bodies are serialized once and the same bytes are resent on every retry.
+    json_body: bytes | None = None
+    if method != "GET" and cfg.content_type not in ("multipart/form-data", "application/x-www-form-urlencoded"):
+        json_body = to_json(cfg.data or {})
+    request_body_log = _snapshot_request_body_for_logging(cfg.content_type, method, cfg.data, cfg.files)
+
     start_time = cfg.progress_origin_ts if cfg.progress_origin_ts is not None else time.monotonic()
     attempt = 0
     delay = cfg.retry_delay
@@ -593,7 +630,6 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
         attempt += 1
         stop_event = asyncio.Event()
         monitor_task: asyncio.Task | None = None
-        sess: aiohttp.ClientSession | None = None
 
         operation_id = _generate_operation_id(method, cfg.endpoint.path, attempt)
         logging.debug("[DEBUG] HTTP %s %s (attempt %d)", method, url, attempt)
@@ -607,13 +643,11 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
         payload_kw: dict[str, Any] = {"headers": payload_headers}
         if method == "GET":
             payload_headers.pop("Content-Type", None)
-        request_body_log = _snapshot_request_body_for_logging(cfg.content_type, method, cfg.data, cfg.files)
         try:
             if cfg.monitor_progress:
                 monitor_task = asyncio.create_task(_monitor(stop_event, start_time))
 
             timeout = aiohttp.ClientTimeout(total=cfg.timeout)
-            sess = aiohttp.ClientSession(timeout=timeout)
 
             if cfg.content_type == "multipart/form-data" and method != "GET":
                 # aiohttp will set Content-Type boundary; remove any fixed Content-Type
@@ -649,9 +683,9 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
             elif cfg.content_type == "application/x-www-form-urlencoded" and method != "GET":
                 payload_headers["Content-Type"] = "application/x-www-form-urlencoded"
                 payload_kw["data"] = cfg.data or {}
-            elif method != "GET":
+            elif json_body is not None:
                 payload_headers["Content-Type"] = "application/json"
-                payload_kw["json"] = cfg.data or {}
+                payload_kw["data"] = json_body
 
             try:
                 request_logger.log_request_response(
@@ -665,7 +699,7 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
             except Exception as _log_e:
                 logging.debug("[DEBUG] request logging failed: %s", _log_e)
 
-            req_coro = sess.request(method, url, params=params, **payload_kw)
+            req_coro = get_client_session().request(method, url, params=params, timeout=timeout, **payload_kw)
             req_task = asyncio.create_task(req_coro)
 
             # Race: request vs. monitor (interruption)
@@ -766,16 +800,12 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
                         logging.debug("[DEBUG] response logging failed: %s", _log_e)
                     return bytes_payload
                 else:
+                    body_bytes = await resp.read()
                     try:
-                        payload = await resp.json()
-                        response_content_to_log: Any = payload
-                    except (ContentTypeError, json.JSONDecodeError):
-                        text = await resp.text()
-                        try:
-                            payload = json.loads(text) if text else {}
-                        except json.JSONDecodeError:
-                            payload = {"_raw": text}
-                        response_content_to_log = payload if isinstance(payload, dict) else text
+                        payload = from_json(body_bytes) if body_bytes else {}
+                    except ValueError:
+                        payload = {"_raw": body_bytes.decode(resp.get_encoding(), errors="replace")}
+                    response_content_to_log: Any = payload
                     with contextlib.suppress(Exception):
                         extracted_price = cfg.price_extractor(payload) if cfg.price_extractor else None
                     operation_succeeded = True
@@ -869,9 +899,6 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
                 monitor_task.cancel()
                 with contextlib.suppress(Exception):
                     await monitor_task
-            if sess:
-                with contextlib.suppress(Exception):
-                    await sess.close()
             if operation_succeeded and cfg.monitor_progress and cfg.final_label_on_success:
                 _display_time_progress(
                     cfg.node_cls,
@@ -888,7 +915,8 @@ async def _request_base(cfg: _RequestConfig, expect_binary: bool):
                 )
 
 
-def _validate_or_raise(response_model: type[M], payload: Any) -> M:
+def validate_response_model(response_model: type[M], payload: Any) -> M:
+    """Validate a JSON response into `response_model`, logging and raising a readable error on failure."""
     try:
         return response_model.model_validate(payload)
     except Exception as e:
@@ -902,27 +930,37 @@ def _validate_or_raise(response_model: type[M], payload: Any) -> M:
         ) from e
 
 
+def _cached_model_validator(response_model: type[M]) -> Callable[[dict[str, Any]], M]:
+    """Return a validator that reuses the model built for the most recent response dict.
+    Shared by all extractors of one operation (and its final result), so each response is validated once.
+    The dict itself is kept, not its `id()`, so a later response can never be matched to a stale model.
+    """
+    last_payload: dict[str, Any] | None = None
+    last_model: M | None = None
+
+    def _validate(d: dict[str, Any]) -> M:
+        nonlocal last_payload, last_model
+        if d is not last_payload:
+            last_model = validate_response_model(response_model, d)
+            last_payload = d
+        return last_model
+
+    return _validate
+
+
 def _wrap_model_extractor(
-    response_model: type[M],
+    validate: Callable[[dict[str, Any]], M],
     extractor: Callable[[M], Any] | None,
 ) -> Callable[[dict[str, Any]], Any] | None:
     """Wrap a typed extractor so it can be used by the dict-based poller.
-    Validates the dict into `response_model` before invoking `extractor`.
-    Uses a small per-wrapper cache keyed by `id(dict)` to avoid re-validating
-    the same response for multiple extractors in a single poll attempt.
+    Validates the dict with `validate` (see `_cached_model_validator`) before invoking `extractor`.
     """
     if extractor is None:
         return None
-    _cache: dict[int, M] = {}
 
     def _wrapped(d: dict[str, Any]) -> Any:
         try:
-            key = id(d)
-            model = _cache.get(key)
-            if model is None:
-                model = response_model.model_validate(d)
-                _cache[key] = model
-            return extractor(model)
+            return extractor(validate(d))
         except Exception as e:
             logging.error("Extractor failed (typed -> dict wrapper): %s", e)
             raise
@@ -17,6 +17,7 @@ from . import request_logger
 from ._helpers import (
     default_base_url,
     get_auth_header,
+    get_client_session,
     is_processing_interrupted,
     sleep_with_interrupt,
     to_aiohttp_url,
@@ -26,6 +27,7 @@ from .common_exceptions import ApiServerError, LocalNetworkError, ProcessingInte
 from .conversions import bytesio_to_image_tensor
 
 _RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+_FILE_WRITE_BUFFER = 2 * 1024 * 1024  # coalesce network chunks into fewer, larger disk writes
 
 
 async def download_url_to_bytesio(
@@ -72,7 +74,6 @@ async def download_url_to_bytesio(
 
         is_path_sink = isinstance(dest, (str, Path))
         fhandle = None
-        session: aiohttp.ClientSession | None = None
         stop_evt: asyncio.Event | None = None
         monitor_task: asyncio.Task | None = None
         req_task: asyncio.Task | None = None
@@ -81,7 +82,6 @@ async def download_url_to_bytesio(
             with contextlib.suppress(Exception):
                 request_logger.log_request_response(operation_id=op_id, request_method="GET", request_url=url)
 
-            session = aiohttp.ClientSession(timeout=timeout_cfg)
             stop_evt = asyncio.Event()
 
             async def _monitor():
@@ -95,7 +95,9 @@ async def download_url_to_bytesio(
 
             monitor_task = asyncio.create_task(_monitor())
 
-            req_task = asyncio.create_task(session.get(to_aiohttp_url(url), headers=headers))
+            req_task = asyncio.create_task(
+                get_client_session().get(to_aiohttp_url(url), headers=headers, timeout=timeout_cfg)
+            )
             done, pending = await asyncio.wait({req_task, monitor_task}, return_when=asyncio.FIRST_COMPLETED)
 
             if monitor_task in done and req_task in pending:
@@ -137,7 +139,7 @@ async def download_url_to_bytesio(
                     p = Path(str(dest))
                     with contextlib.suppress(Exception):
                         p.parent.mkdir(parents=True, exist_ok=True)
-                    fhandle = open(p, "wb")
+                    fhandle = open(p, "wb", buffering=_FILE_WRITE_BUFFER)
                     sink = fhandle
                 else:
                     sink = dest  # BytesIO or file-like
@@ -208,9 +210,6 @@ async def download_url_to_bytesio(
                 req_task.cancel()
                 with contextlib.suppress(Exception):
                     await req_task
-            if session:
-                with contextlib.suppress(Exception):
-                    await session.close()
             if fhandle:
                 with contextlib.suppress(Exception):
                     fhandle.flush()
@@ -13,7 +13,7 @@ from pydantic import BaseModel, Field
 from comfy_api.latest import IO, Input, Types
 
 from . import request_logger
-from ._helpers import is_processing_interrupted, sleep_with_interrupt
+from ._helpers import get_client_session, is_processing_interrupted, sleep_with_interrupt
 from .client import (
     ApiEndpoint,
     _diagnose_connectivity,
@@ -28,6 +28,9 @@ from .conversions import (
 )
 
 
+_MAX_CONCURRENT_UPLOADS = 8
+
+
 class UploadRequest(BaseModel):
     file_name: str = Field(..., description="Filename to upload")
     content_type: str | None = Field(
@@ -52,8 +55,8 @@ async def upload_images_to_comfyapi(
     total_pixels: int = 2048 * 2048,
 ) -> list[str]:
     """
-    Uploads images to ComfyUI API and returns download URLs.
-    To upload multiple images, stack them in the batch dimension first.
+    Uploads images to ComfyUI API and returns download URLs (in input order).
+    To upload multiple images, stack them in the batch dimension first; they are uploaded concurrently.
     """
     tensors: list[torch.Tensor] = []
     if isinstance(image, list):
@@ -71,21 +74,29 @@ async def upload_images_to_comfyapi(
             tensors.append(image)
 
     # if batched, try to upload each file if max_images is greater than 0
-    download_urls: list[str] = []
     num_to_upload = min(len(tensors), max_images)
     batch_start_ts = time.monotonic()
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
 
-    for idx in range(num_to_upload):
-        tensor = tensors[idx]
-        img_io = tensor_to_bytesio(tensor, total_pixels=total_pixels, mime_type=mime_type)
+    async def _upload(idx: int) -> str:
+        async with semaphore:
+            img_io = tensor_to_bytesio(tensors[idx], total_pixels=total_pixels, mime_type=mime_type)
 
-        effective_label = wait_label
-        if wait_label and show_batch_index and num_to_upload > 1:
-            effective_label = f"{wait_label} ({idx + 1}/{num_to_upload})"
+            effective_label = wait_label
+            if wait_label and show_batch_index and num_to_upload > 1:
+                effective_label = f"{wait_label} ({idx + 1}/{num_to_upload})"
 
-        url = await upload_file_to_comfyapi(cls, img_io, img_io.name, mime_type, effective_label, batch_start_ts)
-        download_urls.append(url)
-    return download_urls
+            return await upload_file_to_comfyapi(cls, img_io, img_io.name, mime_type, effective_label, batch_start_ts)
+
+    # Upload concurrently; gather keeps the returned URLs in input order.
+    tasks = [asyncio.create_task(_upload(idx)) for idx in range(num_to_upload)]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 async def upload_audio_to_comfyapi(
@@ -231,7 +242,6 @@ async def upload_file(
                 return
 
         monitor_task = asyncio.create_task(_monitor())
-        sess: aiohttp.ClientSession | None = None
         try:
             try:
                 request_logger.log_request_response(
@@ -245,8 +255,9 @@ async def upload_file(
             except Exception as e:
                 logging.debug("[DEBUG] upload request logging failed: %s", e)
 
-            sess = aiohttp.ClientSession(timeout=timeout)
-            req = sess.put(upload_url, data=data, headers=headers, skip_auto_headers=skip_auto_headers)
+            req = get_client_session().put(
+                upload_url, data=data, headers=headers, skip_auto_headers=skip_auto_headers, timeout=timeout
+            )
             req_task = asyncio.create_task(req)
 
             done, pending = await asyncio.wait({req_task, monitor_task}, return_when=asyncio.FIRST_COMPLETED)
@@ -337,9 +348,6 @@ async def upload_file(
                 monitor_task.cancel()
                 with contextlib.suppress(Exception):
                     await monitor_task
-            if sess:
-                with contextlib.suppress(Exception):
-                    await sess.close()
 
 
 def _generate_operation_id(method: str, url: str, attempt: int, op_uuid: str) -> str:
@@ -0,0 +1,113 @@
+import pytest
+from pydantic import BaseModel, model_validator
+
+from comfy_api_nodes.util import ApiEndpoint, client, poll_op, poll_op_raw
+
+
+class _Task(BaseModel):
+    status: str
+    progress: int | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _count(cls, data):
+        _validated.append(data)
+        return data
+
+
+_validated: list[dict] = []
+
+
+def _serve(monkeypatch, responses: list[dict]) -> list[float]:
+    """Make every poll return the next response as a fresh dict, without network, sleeping or UI updates.
+    Returns the list the requested sleep delays are recorded into.
+    """
+    pending = iter(responses)
+    delays: list[float] = []
+
+    async def fake_sync_op_raw(*args, **kwargs):
+        return dict(next(pending))
+
+    async def fake_sleep(seconds, *args, **kwargs):
+        delays.append(seconds)
+
+    monkeypatch.setattr(client, "sync_op_raw", fake_sync_op_raw)
+    monkeypatch.setattr(client, "sleep_with_interrupt", fake_sleep)
+    monkeypatch.setattr(client, "_display_time_progress", lambda *args, **kwargs: None)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_poll_op_validates_each_response_once(monkeypatch):
+    _serve(
+        monkeypatch,
+        [
+            {"status": "processing", "progress": 10},
+            {"status": "processing", "progress": 60},
+            {"status": "completed", "progress": 100},
+        ],
+    )
+    _validated.clear()
+
+    result = await poll_op(
+        None,
+        ApiEndpoint(path="/proxy/task/1"),
+        response_model=_Task,
+        status_extractor=lambda r: r.status,
+        progress_extractor=lambda r: r.progress,
+        price_extractor=lambda r: 0.1,
+    )
+
+    # one validation per response, shared by the three extractors and the returned model
+    assert [d["progress"] for d in _validated] == [10, 60, 100]
+    assert result == _Task(status="completed", progress=100)
+
+
+@pytest.mark.asyncio
+async def test_poll_backoff_schedule(monkeypatch):
+    step = client._POLL_PROGRESS_STEP
+    progress = [0, 0, 0, 0, step, 2 * step, 3 * step, 4 * step, 5 * step - 1]
+    delays = _serve(
+        monkeypatch,
+        [{"status": "processing", "progress": p} for p in progress] + [{"status": "completed", "progress": 100}],
+    )
+    jitter_ranges: list[tuple[float, float]] = []
+
+    def fake_uniform(a, b):
+        jitter_ranges.append((a, b))
+        return b
+
+    monkeypatch.setattr(client.random, "uniform", fake_uniform)
+
+    await poll_op_raw(
+        None,
+        ApiEndpoint(path="/proxy/task/1"),
+        status_extractor=lambda r: r["status"],
+        progress_extractor=lambda r: r["progress"],
+        poll_interval=1.0,
+        max_poll_interval=8.0,
+    )
+
+    # doubles while flat, caps at 8, halves on each full step down to the floor, doubles again on a smaller gain
+    assert delays == [2.0, 4.0, 8.0, 8.0, 4.0, 2.0, 1.0, 1.0, 2.0]
+    # jitter never goes below poll_interval
+    assert jitter_ranges == [(max(1.0, b / 2), b) for b in delays]
+
+
+@pytest.mark.asyncio
+async def test_poll_backoff_keeps_fixed_schedule_timeout_budget(monkeypatch):
+    delays = _serve(monkeypatch, [{"status": "processing", "progress": 0}] * 10)
+    monkeypatch.setattr(client.random, "uniform", lambda a, b: b)
+
+    with pytest.raises(Exception, match="timed out after 3 non-queued attempts"):
+        await poll_op_raw(
+            None,
+            ApiEndpoint(path="/proxy/task/1"),
+            status_extractor=lambda r: r["status"],
+            progress_extractor=lambda r: r["progress"],
+            poll_interval=1.0,
+            max_poll_interval=8.0,
+            max_poll_attempts=10,
+        )
+    # a fixed schedule would have slept 10 x 1s; backing off stops once that much active time is spent
+    assert delays == [2.0, 4.0, 8.0]
@@ -0,0 +1,7 @@
+import torch
+
+import utils.install_util  # noqa: F401  imported before nodes.py prepends comfy/ to sys.path and shadows `utils`
+from comfy.cli_args import args
+
+if not torch.cuda.is_available():
+    args.cpu = True
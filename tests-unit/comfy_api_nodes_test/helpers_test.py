@@ -0,0 +1,36 @@
+import asyncio
+
+from comfy_api_nodes.util import _helpers
+from comfy_api_nodes.util._helpers import get_client_session
+
+
+async def _get_session():
+    return get_client_session()
+
+
+def test_client_session_reused_within_loop():
+    async def main():
+        return get_client_session(), get_client_session()
+
+    first, second = asyncio.run(main())
+    assert first is second
+
+
+def test_client_session_closed_after_asyncio_run():
+    session = asyncio.run(_get_session())
+    assert session.closed
+    assert not _helpers._SESSIONS
+
+
+def test_client_session_not_shared_between_loops():
+    assert asyncio.run(_get_session()) is not asyncio.run(_get_session())
+
+
+def test_client_session_dropped_for_loop_closed_without_cancelling():
+    loop = asyncio.new_event_loop()
+    stale = loop.run_until_complete(_get_session())
+    loop.close()  # no task cancellation, so the shutdown hook never runs
+    assert loop in _helpers._SESSIONS
+
+    assert asyncio.run(_get_session()) is not stale
+    assert loop not in _helpers._SESSIONS
@@ -0,0 +1,47 @@
+import asyncio
+import re
+
+import pytest
+import torch
+
+from comfy_api_nodes.util import upload_helpers
+from comfy_api_nodes.util.upload_helpers import upload_images_to_comfyapi
+
+
+def _batch_index(label: str) -> int:
+    return int(re.search(r"\((\d+)/\d+\)", label).group(1)) - 1
+
+
+@pytest.mark.asyncio
+async def test_upload_images_returns_urls_in_input_order(monkeypatch):
+    async def fake_upload(cls, img_io, filename, mime_type, wait_label, progress_origin_ts):
+        idx = _batch_index(wait_label)
+        await asyncio.sleep(0.01 * (4 - idx))  # later images finish first
+        return f"https://storage/{idx}"
+
+    monkeypatch.setattr(upload_helpers, "upload_file_to_comfyapi", fake_upload)
+
+    urls = await upload_images_to_comfyapi(None, torch.rand(4, 8, 8, 3))
+    assert urls == [f"https://storage/{i}" for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_upload_images_cancels_remaining_uploads_on_failure(monkeypatch):
+    cancelled = []
+
+    async def fake_upload(cls, img_io, filename, mime_type, wait_label, progress_origin_ts):
+        idx = _batch_index(wait_label)
+        if idx == 1:
+            raise RuntimeError("upload failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(idx)
+            raise
+        return f"https://storage/{idx}"
+
+    monkeypatch.setattr(upload_helpers, "upload_file_to_comfyapi", fake_upload)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await upload_images_to_comfyapi(None, torch.rand(3, 8, 8, 3))
+    assert sorted(cancelled) == [0, 2]